@@ -174,11 +174,17 @@ class TestUnlimitedIPList(unittest.TestCase):
         valid_ipv4 = "10.10.10.10/8"
         self.assertEqual(self.unlimited_ip_list.get_valid_cidr(valid_ipv4, normalize=True),'10.0.0.0/8')
         self.assertIsNone(self.unlimited_ip_list.get_valid_cidr(valid_ipv4, normalize=False))
+        # a zero-padded prefix is accepted by is_valid_cidr and must be accepted here too
+        self.assertTrue(self.unlimited_ip_list.is_valid_cidr("1.2.3.4/032"))
+        self.assertEqual(self.unlimited_ip_list.get_valid_cidr("1.2.3.4/032", normalize=True),'1.2.3.4/32')
 
     def test_24_get_valid_cidr_ipv6(self):
         valid_ipv6 = "2001:db8::1/64"
         self.assertEqual(self.unlimited_ip_list.get_valid_cidr(valid_ipv6, normalize=True),'2001:0db8::/64')
         self.assertIsNone(self.unlimited_ip_list.get_valid_cidr(valid_ipv6, normalize=False))
+        # a zero-padded prefix is accepted by is_valid_cidr and must be accepted here too
+        self.assertTrue(self.unlimited_ip_list.is_valid_cidr("2001:db8::/064"))
+        self.assertEqual(self.unlimited_ip_list.get_valid_cidr("2001:db8::/064", normalize=True),'2001:0db8::/64')
 
     def test_25_check_all_ipaddr(self):
         ipv4_count, ipv4_false_count = 0, 0
@@ -209,6 +215,68 @@ class TestUnlimitedIPList(unittest.TestCase):
         if BENCH:
             self.print_stats(len(self.ip_random_list), time_list, ipv4_count, ipv4_false_count, ipv6_count, ipv6_false_count)
 
+    def test_26_add_to_homogeneous_slash24_list(self):
+        ip_list = UnlimitedIPList(ip_networks_list=["10.0.0.0/24","10.0.2.0/24","10.0.4.0/24"],normalize_invalid_cidr=True,raise_on_error=False,debug=False)
+        result = ip_list.add_ip_network("10.0.3.0/24")
+        self.assertTrue(result)
+        self.assertEqual(ip_list.check_ipaddr("10.0.3.10"),"10.0.3.0/24")
+        self.assertEqual(ip_list.check_ipaddr("10.0.2.10"),"10.0.2.0/24")
+        self.assertFalse(ip_list.check_ipaddr("10.0.1.10"))
+
+    def test_27_add_to_homogeneous_slash16_list(self):
+        ip_list = UnlimitedIPList(ip_networks_list=["10.0.0.0/16","10.2.0.0/16","172.16.0.0/20"],normalize_invalid_cidr=True,raise_on_error=False,debug=False)
+        result = ip_list.add_ip_network("10.1.0.0/16")
+        self.assertTrue(result)
+        self.assertEqual(ip_list.check_ipaddr("10.1.2.3"),"10.1.0.0/16")
+        self.assertEqual(ip_list.check_ipaddr("172.16.10.10"),"172.16.0.0/20")
+        self.assertFalse(ip_list.check_ipaddr("10.3.0.1"))
+
+    def test_28_add_breaking_homogeneity(self):
+        ip_list = UnlimitedIPList(ip_networks_list=["10.0.0.0/24","10.0.2.0/24"],normalize_invalid_cidr=True,raise_on_error=False,debug=False)
+        result = ip_list.add_ip_network("172.16.0.0/12")
+        self.assertTrue(result)
+        self.assertEqual(ip_list.check_ipaddr("172.20.1.1"),"172.16.0.0/12")
+        self.assertEqual(ip_list.check_ipaddr("10.0.0.1"),"10.0.0.0/24")
+        self.assertFalse(ip_list.check_ipaddr("192.168.0.1"))
+        ipv6_list = UnlimitedIPList(ip_networks_list=["2001:0db8::/64","2001:0db9::/64"],normalize_invalid_cidr=True,raise_on_error=False,debug=False)
+        result = ipv6_list.add_ip_network("2002::/32")
+        self.assertTrue(result)
+        self.assertEqual(ipv6_list.check_ipaddr("2002::1"),"2002::/32")
+        self.assertEqual(ipv6_list.check_ipaddr("2001:0db8::1"),"2001:0db8::/64")
+        self.assertFalse(ipv6_list.check_ipaddr("2003::1"))
+
+    def test_29_incremental_add_matches_bulk_build(self):
+        incremental = UnlimitedIPList(ip_networks_list=[self.ip_network_list[0]],normalize_invalid_cidr=True,raise_on_error=False,debug=False)
+        for cidr in self.ip_network_list[1:]:
+            incremental.add_ip_network(cidr)
+        bulk = UnlimitedIPList(ip_networks_list=incremental.get_ip_networks_list(),normalize_invalid_cidr=True,raise_on_error=False,debug=False)
+        self.assertEqual(incremental.get_ip_networks_list(),bulk.get_ip_networks_list())
+        for ip in self.ip_random_list:
+            self.assertEqual(incremental.check_ipaddr(ip),bulk.check_ipaddr(ip))
+
+    def test_30_check_ipaddrs_matches_check_ipaddr(self):
+        mixed_list = self.ip_random_list[:50] + ["999.999.999.999","not an ip","",None,3.5,self.unlimited_ip_list.ip_to_int("10.10.10.10"),self.unlimited_ip_list.ip_to_int("2001:0db8::1")]
+        expected = [self.unlimited_ip_list.check_ipaddr(ip) for ip in mixed_list]
+        self.assertEqual(self.unlimited_ip_list.check_ipaddrs(mixed_list),expected)
+        self.assertEqual(self.unlimited_ip_list.check_ipaddr_many(mixed_list),expected)
+        self.assertEqual(self.unlimited_ip_list.check_ipaddrs([]),[])
+        empty_ip_list = UnlimitedIPList(ip_networks_list=[],normalize_invalid_cidr=True,raise_on_error=False,debug=False)
+        self.assertEqual(empty_ip_list.check_ipaddrs(mixed_list),[False]*len(mixed_list))
+        strict_ip_list = UnlimitedIPList(ip_networks_list=["10.0.0.0/8"],normalize_invalid_cidr=True,raise_on_error=True,debug=False)
+        with self.assertRaises(UnlimitedIPListException):
+            strict_ip_list.check_ipaddr("bogus")
+        with self.assertRaises(UnlimitedIPListException):
+            strict_ip_list.check_ipaddrs(["10.10.10.10","bogus"])
+
+    def test_31_check_ipaddr_unsupported_types_and_cache(self):
+        self.assertFalse(self.unlimited_ip_list.check_ipaddr([1,2]))
+        self.assertFalse(self.unlimited_ip_list.check_ipaddr({"a":1}))
+        self.assertFalse(self.unlimited_ip_list.check_ipaddr(None))
+        # a cached False result must not survive a list change
+        self.assertFalse(self.unlimited_ip_list.check_ipaddr("10.99.99.99"))
+        self.unlimited_ip_list.add_ip_network("10.99.99.0/24")
+        self.assertEqual(self.unlimited_ip_list.check_ipaddr("10.99.99.99"),"10.99.99.0/24")
+
     def print_stats(self, total, time_list, ipv4_count, ipv4_false_count, ipv6_count, ipv6_false_count):
         print()
         print(f"Elapsed time for checking {total} IP addresses: {sum(time_list):.9f} seconds")
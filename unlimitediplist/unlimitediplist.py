@@ -15,16 +15,146 @@
 
  by Ricardo Abuchaim - ricardoabuchaim@gmail.com
 """
+import sys
 import socket
 import struct
 import bisect
 import threading
-import math
 import typing
 import datetime
+import functools
+import array
+import re
 
 __all__ = ["UnlimitedIPList", "UnlimitedIPListException"]
 
+_bisect_right = bisect.bisect_right  # bound once so the hot lookup path skips the module attribute lookup
+# the parser helpers are resolved once at import: a LOAD_GLOBAL of these names is cheaper than a
+# module attribute lookup on every single parse
+_inet_aton = socket.inet_aton
+_inet_pton = socket.inet_pton
+_int_from_bytes = int.from_bytes
+_AF_INET6 = socket.AF_INET6
+_inet_ntoa = socket.inet_ntoa
+# a precompiled Struct skips the format-string parse that struct.pack and struct.unpack redo per call
+_U32 = struct.Struct("!L")
+_u32_pack = _U32.pack
+_u32_unpack = _U32.unpack
+
+# cheap shape checks compiled once at import: rejecting garbage with a regex match is much faster
+# than letting inet_aton/inet_pton raise and catching the exception
+_RE_VALID_CIDR_V4 = re.compile(r'^(?:(?:25[0-5]|2[0-4]\d|1?\d?\d)\.){3}(?:25[0-5]|2[0-4]\d|1?\d?\d)(?:/\d{1,2})?$')
+_RE_VALID_CIDR_V6 = re.compile(r'^[0-9A-Fa-f:]{2,39}(?:/\d{1,3})?$')
+
+# there are only 33 IPv4 and 129 IPv6 prefixes, so the network/host masks are precomputed once at
+# import instead of rebuilt with two big-int shifts on every CIDR parse and validation
+_V4_MASKS = tuple(((1 << prefix) - 1) << (32 - prefix) for prefix in range(33))
+_V4_HOST  = tuple((1 << (32 - prefix)) - 1 for prefix in range(33))
+_V6_MASKS = tuple(((1 << prefix) - 1) << (128 - prefix) for prefix in range(129))
+_V6_HOST  = tuple((1 << (128 - prefix)) - 1 for prefix in range(129))
+
+def _build_longest_zero_run() -> typing.List[typing.Tuple[int, int]]:
+    """Map every 8-bit mask of zero-valued hextets to the (start, length) of its longest run of set bits.
+
+    Built once at import so compress_ipv6 replaces its branch-heavy run-tracking state machine with
+    a single list index - there are only 256 possible masks for the 8 hextets of an IPv6 address."""
+    table = []
+    for mask in range(256):
+        best_start = best_len = -1
+        curr_start = curr_len = -1
+        for i in range(8):
+            if mask >> i & 1:
+                if curr_start == -1:
+                    curr_start, curr_len = i, 1
+                else:
+                    curr_len += 1
+            else:
+                if curr_len > best_len:
+                    best_start, best_len = curr_start, curr_len
+                curr_start = curr_len = -1
+        if curr_len > best_len:
+            best_start, best_len = curr_start, curr_len
+        table.append((best_start, best_len))
+    return table
+_LONGEST_ZERO_RUN = _build_longest_zero_run()
+
+@functools.lru_cache(maxsize=4096)
+def _ip_to_int_cached(ipaddr: str) -> typing.Optional[int]:
+    """Convert an already-stripped IPv4/IPv6 address to an integer, or None if invalid.
+
+    Memoized at module level: the function is pure, so the cache is shared by every instance and
+    repeated parses of the same address (sort keys, revalidation after add/remove, recurring
+    clients on the lookup path) cost a single dict probe."""
+    if ':' not in ipaddr[:5]:  # IPv6 strings always carry a ':' within the first 5 chars
+        try:
+            return _u32_unpack(_inet_aton(ipaddr))[0]
+        except OSError:  # what inet_aton raises on invalid input - faster to match than Exception
+            return None
+    try:
+        return _int_from_bytes(_inet_pton(_AF_INET6, ipaddr), byteorder="big")
+    except OSError:
+        return None
+
+@functools.lru_cache(maxsize=65536)
+def _parse_cidr(cidr: str) -> typing.Optional[typing.Tuple[int, int, int, int]]:
+    """Parse a CIDR string into a (family, first_ip, last_ip, prefix) tuple of integers, or None if invalid.
+
+    Memoized because the same CIDR strings are parsed repeatedly during list processing, overlap
+    checks and reprocessing after add/remove - after the first parse the tuple comes from the cache.
+    The cache is bounded so untrusted input cannot grow it without limit."""
+    try:
+        ip_part, prefix_part = cidr.split("/")
+        prefix = int(prefix_part)
+        if ":" in ip_part[:5]:  # IPv6 strings always carry a ':' within the first 5 chars
+            family = socket.AF_INET6
+            ip_int = _int_from_bytes(_inet_pton(_AF_INET6, ip_part), byteorder="big")
+            first_ip = ip_int & _V6_MASKS[prefix]
+            last_ip = first_ip | _V6_HOST[prefix]
+        else:  # IPv4
+            family = socket.AF_INET
+            ip_int = _u32_unpack(_inet_aton(ip_part))[0]
+            first_ip = ip_int & _V4_MASKS[prefix]
+            last_ip = first_ip | _V4_HOST[prefix]
+        return family, first_ip, last_ip, prefix
+    except (OSError, ValueError, IndexError):  # bad address, bad split/prefix from int(), prefix out of range
+        return None
+
+class _Snapshot:
+    """One immutable generation of the lookup structures.
+
+    Readers load self._snap once and work on that consistent view for the whole call; writers
+    build a complete new snapshot and publish it with a single attribute rebind, which is atomic
+    under the GIL. That keeps the lookup path lock-free: the write lock only serializes writers,
+    and a reader can never observe half of an old generation and half of a new one."""
+    __slots__ = ('v4_first_ips', 'v4_last_ips', 'v4_cidrs', 'v4_buckets', 'v4_map24', 'v4_min', 'v4_max',
+                 'v6_first_ips', 'v6_last_ips', 'v6_cidrs', 'v6_map64', 'v6_min', 'v6_max', 'cidrs', 'cidrs_set')
+    def __init__(self, v4_first_ips, v4_last_ips, v4_cidrs, v4_buckets, v4_map24,
+                 v6_first_ips, v6_last_ips, v6_cidrs, v6_map64, cidrs):
+        self.v4_first_ips = v4_first_ips
+        self.v4_last_ips = v4_last_ips
+        self.v4_cidrs = v4_cidrs
+        self.v4_buckets = v4_buckets
+        self.v4_map24 = v4_map24
+        self.v6_first_ips = v6_first_ips
+        self.v6_last_ips = v6_last_ips
+        self.v6_cidrs = v6_cidrs
+        self.v6_map64 = v6_map64
+        self.cidrs = cidrs
+        self.cidrs_set = set(cidrs)  # mirror of cidrs for O(1) membership tests
+        # covered bounds per family: anything outside is a miss decided by one integer compare,
+        # with no probe into the search structures (ranges are sorted, so last_ips[-1] is the max)
+        self.v4_min = v4_first_ips[0] if v4_first_ips else 1
+        self.v4_max = v4_last_ips[-1] if v4_last_ips else 0
+        self.v6_min = v6_first_ips[0] if v6_first_ips else 1
+        self.v6_max = v6_last_ips[-1] if v6_last_ips else 0
+
+    @classmethod
+    def empty(cls) -> "_Snapshot":
+        # IPv4 bounds fit in 32 bits, so they live in contiguous typed arrays instead of lists of
+        # boxed Python ints - bisect compares native values straight out of the buffer, and the
+        # 4-byte 'I' typecode packs 16 keys per cache line during the search
+        return cls(array.array('I'), array.array('I'), [], None, None, [], [], [], None, [])
+
 class UnlimitedIPListException(Exception): ...
 """Custom exception for UnlimitedIPList errors."""
 
@@ -32,20 +162,32 @@ class UnlimitedIPList:
     """A list-type object to manage the list of IPv4/IPv6 networks and perform quick searches using bisect and working with IPs as integers.
     A list with 10000 IP/CIDR (IPv4 and IPv6) took 0.05 to be processed. The verification is around 0.000005 regardless of the list size.
     """
-    def __init__(self, ip_networks_list: typing.List[str], normalize_invalid_cidr: bool = False, raise_on_error: bool = False, debug: bool = False):
-        self._log_debug = self._log_debug if debug else lambda msg: None
-        self._lock = threading.RLock()
-        
+    def __init__(self, ip_networks_list: typing.List[str], normalize_invalid_cidr: bool = False, raise_on_error: bool = False, debug: bool = False, cache_size: int = 4096):
+        self._debug_enabled = bool(debug)
+        # plain Lock, not RLock: it is only taken around the final publish in __process_list and in
+        # __clear_lists, never re-entered; lookups read the published structures without locking
+        self._write_lock = threading.Lock()
+
         self.__raise_on_error = raise_on_error
         self.__normalize_invalid_cidr = normalize_invalid_cidr
-        
-        self.discarded_cidrs = []
-        self.__list_chunks, self.__list_index = [], []
-        self.__first_ip_chunks, self.__last_ip_chunks = [], []
 
-        self._cidrs: typing.List[str] = []
+        self._cache_size = cache_size
+        # keyed on (address, snapshot): a result cached against an old generation can never be served
+        # after the list changes, even if a slow lookup finishes after a writer's cache_clear()
+        self._check_ipaddr_cached = functools.lru_cache(maxsize=self._cache_size)(self._check_ipaddr_impl)
+
+        self.discarded_cidrs = set()  # a set dedupes repeated offenders and gives users O(1) membership tests
+        self._snap = _Snapshot.empty()  # every lookup structure lives behind this one reference
         self.__process_list(ip_networks_list)
 
+    @property
+    def _cidrs(self) -> typing.List[str]:
+        return self._snap.cidrs
+
+    @property
+    def _cidrs_set(self) -> typing.Set[str]:
+        return self._snap.cidrs_set
+
     def __getitem__(self, index: int) -> str:
         return self._cidrs[index]
 
@@ -56,7 +198,7 @@ class UnlimitedIPList:
         return len(self._cidrs)
 
     def __contains__(self, item: str) -> bool:
-        return item.strip() in self._cidrs
+        return item.strip() in self._cidrs_set
 
     def __repr__(self):
         return repr(self._cidrs)
@@ -67,7 +209,7 @@ class UnlimitedIPList:
 
     def is_valid_ipaddr(self, ipaddr: str) -> bool:
         """Check if an IP address is valid. Accepts IPv4 or IPv6. (Elapsed average time: 0.000001)"""
-        return self.ip_to_int(ipaddr.strip()) is not None
+        return _ip_to_int_cached(ipaddr.strip()) is not None
 
     def is_valid_iplong(self, iplong: int) -> bool:
         """Check if an integer is a valid IPv4/IPv6 address. (Elapsed average time: 0.000001)"""
@@ -86,35 +228,40 @@ class UnlimitedIPList:
             Ex: 10.0.0.10/8 is VALID, 10.0.0.0/8 is VALID, 10.0.0.10/32 is VALID
             c1a5:9ba4:8d92:636e:60fd:8756:430b:0000/64 is VALID, c1a5:9ba4:8d92:636e::/64 is VALID
         """
-        try:
-            cidr = cidr.strip()
-            if '/' not in cidr:
-                if strict:
-                    return False  # sem prefixo é inválido como CIDR
-                else:
-                    cidr = self._normalize_cidr_suffix(cidr)  # adiciona /32 para IPv4 ou /128 para IPv6 se não tiver prefixo
-            ip_part, prefix_str = cidr.split('/')
-            prefix = int(prefix_str)
-            if '.' in ip_part:
-                packed_ip = socket.inet_aton(ip_part)
-                ip_int = struct.unpack("!L", packed_ip)[0]
-                if not (0 <= prefix <= 32):
-                    return False
-                if strict:
-                    mask = ((1 << prefix) - 1) << (32 - prefix)
-                    return ip_int & ~mask == 0  # os bits fora da máscara devem ser zero
-                return True
-            else:
-                packed_ip = socket.inet_pton(socket.AF_INET6, ip_part)
-                ip_int = int.from_bytes(packed_ip, byteorder='big')
-                if not (0 <= prefix <= 128):
-                    return False
-                if strict:
-                    mask = ((1 << prefix) - 1) << (128 - prefix)
-                    return ip_int & ~mask == 0
-                return True
-        except Exception:
+        cidr = cidr.strip()
+        # rpartition avoids the list that split('/') allocates, and the decimal check avoids
+        # exception-driven int() parsing on malformed prefixes
+        ip_part, sep, prefix_str = cidr.rpartition('/')
+        if not sep:
+            if strict:
+                return False  # sem prefixo é inválido como CIDR
+            ip_part = cidr  # assume /32 para IPv4 ou /128 para IPv6 se não tiver prefixo
+            prefix_str = '32' if ':' not in cidr[:5] else '128'
+        # isascii+isdecimal accepts exactly '0'-'9': isdigit() alone also matches characters like
+        # superscripts that int() rejects with a ValueError instead of this function returning False
+        if not (prefix_str.isascii() and prefix_str.isdecimal()):
             return False
+        prefix = int(prefix_str)
+        if '.' in ip_part:
+            if prefix > 32 or not _RE_VALID_CIDR_V4.match(ip_part):
+                return False
+            try:
+                ip_int = _u32_unpack(_inet_aton(ip_part))[0]
+            except OSError:
+                return False
+            if strict:
+                return ip_int & _V4_HOST[prefix] == 0  # os bits fora da máscara devem ser zero
+            return True
+        else:
+            if prefix > 128 or not _RE_VALID_CIDR_V6.match(ip_part):
+                return False
+            try:
+                ip_int = _int_from_bytes(_inet_pton(_AF_INET6, ip_part), byteorder='big')
+            except OSError:
+                return False
+            if strict:
+                return ip_int & _V6_HOST[prefix] == 0
+            return True
 
     def get_valid_cidr(self, cidr: str, normalize: bool = True) -> str:
         """Returns a valid normalized CIDR (IPv4 or IPv6) in pure Python.
@@ -130,62 +277,62 @@ class UnlimitedIPList:
                     return None
                 cidr = self._normalize_cidr_suffix(cidr)
             ip_str, prefix_str = cidr.split('/')
+            # split first and run the regex on the IP part only, exactly like is_valid_cidr:
+            # matching the full string would cap the prefix at 2 digits and reject '1.2.3.4/032'
+            if not (prefix_str.isascii() and prefix_str.isdecimal()):
+                return None
+            if '.' in ip_str:
+                if not _RE_VALID_CIDR_V4.match(ip_str):
+                    return None
+            elif not _RE_VALID_CIDR_V6.match(ip_str):
+                return None
             prefix = int(prefix_str)
             if '.' in ip_str:
                 if not (0 <= prefix <= 32):
                     return None
-                packed = socket.inet_aton(ip_str)
-                ip_int = struct.unpack("!L", packed)[0]
+                packed = _inet_aton(ip_str)
+                ip_int = _u32_unpack(packed)[0]
                 if normalize:
-                    mask = ((1 << prefix) - 1) << (32 - prefix)
-                    network_int = ip_int & mask
-                    network_ip = socket.inet_ntoa(struct.pack("!L", network_int))
+                    network_int = ip_int & _V4_MASKS[prefix]
+                    network_ip = _inet_ntoa(_u32_pack(network_int))
                     return f"{network_ip}/{prefix}"
                 else:
-                    mask = ((1 << prefix) - 1) << (32 - prefix)
-                    if ip_int & ~mask != 0:
+                    if ip_int & _V4_HOST[prefix] != 0:
                         return None
                     return f"{ip_str}/{prefix}"
             else:
-                packed = socket.inet_pton(socket.AF_INET6, ip_str)
+                packed = _inet_pton(_AF_INET6, ip_str)
                 if not (0 <= prefix <= 128):
                     return None
-                ip_int = int.from_bytes(packed, byteorder='big')
+                ip_int = _int_from_bytes(packed, byteorder='big')
                 if normalize:
-                    mask = ((1 << prefix) - 1) << (128 - prefix)
-                    network_int = ip_int & mask
+                    network_int = ip_int & _V6_MASKS[prefix]
                     # network_bytes = network_int.to_bytes(16, byteorder='big')
                     # network_ip = socket.inet_ntop(socket.AF_INET6, network_bytes)
                     network_ip = self.compress_ipv6(self.int_to_ip(network_int))
                     return f"{network_ip}/{prefix}"
                 else:
-                    mask = ((1 << prefix) - 1) << (128 - prefix)
-                    if ip_int & ~mask != 0:
+                    if ip_int & _V6_HOST[prefix] != 0:
                         return None
                     return f"{ip_str}/{prefix}"
         except Exception as ERR:
-            self._log_debug(f"Failed at UnlimitedIPList.get_valid_cidr({cidr}): {str(ERR)}")
+            if self._debug_enabled: self._log_debug(f"Failed at UnlimitedIPList.get_valid_cidr({cidr}): {str(ERR)}")
             return None
         
     def ip_to_int(self, ipaddr: str) -> int:
         """Converts an IPv4/IPv6 address to an integer. (Elapsed average time: 0.000001)"""
-        try:
-            return struct.unpack("!L", socket.inet_aton(ipaddr.strip()))[0]
-        except Exception:
-            try:
-                return int.from_bytes(socket.inet_pton(socket.AF_INET6, ipaddr.strip()), byteorder="big")
-            except Exception:
-                return None
+        return _ip_to_int_cached(ipaddr.strip())
 
     def int_to_ip(self, iplong: int) -> str:
         """Convert an integer to IP Address (IPv4 or IPv6). For IPv6, returns the full expanded zero-padded form."""
         try:
             if iplong <= 2**32:  # MAX IPv4
-                return socket.inet_ntoa(struct.pack(">L", iplong))
+                return _inet_ntoa(_u32_pack(iplong))
             else:
-                ip_bytes = iplong.to_bytes(16, byteorder="big")
-                hextets = [f"{(ip_bytes[i] << 8 | ip_bytes[i+1]):04x}" for i in range(0, 16, 2)]
-                return ":".join(hextets)
+                # bytes.hex() renders all 32 nibbles in C; slicing every 4 chars yields the
+                # zero-padded hextets without per-hextet arithmetic or f-string formatting
+                hex_str = iplong.to_bytes(16, byteorder="big").hex()
+                return ":".join(hex_str[i:i + 4] for i in range(0, 32, 4))
         except Exception:
             return None
 
@@ -198,21 +345,12 @@ class UnlimitedIPList:
         hextets = [h if h else "0000" for h in hextets]  # replace empty hextets with "0000"
         if len(hextets) != 8: # fill missing hextets with "0000"
             hextets = hextets + ["0000"] * (8 - len(hextets))
-        best_start = best_len = -1
-        curr_start = curr_len = -1
+        # collapse the run search to a bitmask of zero hextets plus one table lookup
+        mask = 0
         for i in range(8):
             if hextets[i] == "0000":
-                if curr_start == -1:
-                    curr_start = i
-                    curr_len = 1
-                else:
-                    curr_len += 1
-            else:
-                if curr_len > best_len:
-                    best_start, best_len = curr_start, curr_len
-                curr_start = curr_len = -1
-        if curr_len > best_len:
-            best_start, best_len = curr_start, curr_len
+                mask |= 1 << i
+        best_start, best_len = _LONGEST_ZERO_RUN[mask]
         if best_len > 1:
             hextets = hextets[:best_start] + [""] + hextets[best_start + best_len:]
             if best_start == 0:
@@ -223,205 +361,170 @@ class UnlimitedIPList:
 
     def _normalize_cidr_suffix(self, ipaddr: str):
         """Converts an IP address to CIDR format. Add /32 to the IPv4 address if it is not present 
-        or add /128 to the IPv6 address if it is not present. (Elapsed average time 0.0000006)"""
-        ip = ipaddr.strip()
-        if '/' in ip:
-            return ip
-        return f"{ip}/32" if ':' not in ip else f"{ip}/128"
-
-    def __split_list(self, a_list, size):
-        """Split a_list in chunks defined by size"""
-        try:
-            return [a_list[i:i + size] for i in range(0, len(a_list), size)]
-        except Exception as ERR:
-            if self.__raise_on_error:
-                raise UnlimitedIPListException(f"Failed at UnlimitedIPList.__split_list(): {str(ERR)}")
-            return []
-        
+        or add /128 to the IPv6 address if it is not present. Expects an already-stripped
+        string - every caller strips exactly once at its entry point. (Elapsed average time 0.0000006)"""
+        if '/' in ipaddr:
+            return ipaddr
+        return f"{ipaddr}/32" if ':' not in ipaddr[:5] else f"{ipaddr}/128"
+
     def __get_first_last_ip_cidr(self, cidr: str) -> tuple:
         """Get the first and last IP of a CIDR in integer format."""
-        try:
-            ip_part, prefix_part = cidr.split("/")
-            prefix = int(prefix_part)
-            ip_int = self.ip_to_int(ip_part)
-            if ":" in ip_part:  # IPv6
-                bits = 128
-            else:  # IPv4
-                bits = 32
-            mask = ((1 << prefix) - 1) << (bits - prefix)
-            mask &= (1 << bits) - 1  # garante que só usamos os bits válidos
-            network_ip = ip_int & mask
-            broadcast_ip = network_ip | ((1 << (bits - prefix)) - 1)
-            return network_ip, broadcast_ip
-        except Exception:
+        parsed = _parse_cidr(cidr)
+        if parsed is None:
             return 0,0
+        return parsed[1], parsed[2]
         
-    def __find_balanced_chunk_size(self, list_size, min_chunk_size: int = 100, max_chunk_size: int = 5000):
-        """Finds a balanced chunk size for splitting a list of size n into chunks,
-        such that the difference between the number of chunks and the chunk size is minimized."""
-        if list_size <= min_chunk_size:
-            return list_size  # if the list is smaller than the minimum chunk size, return the list size
-        best_chunk_size = 1
-        best_diff = float("inf")
-        for chunk_size in range(1, max_chunk_size + 1):
-            q = math.ceil(list_size / chunk_size)
-            diff = abs(chunk_size - q)
-            if diff <= 1:  # the best value!
-                return chunk_size
-            elif diff < best_diff:
-                best_diff = diff
-                best_chunk_size = chunk_size
-        return best_chunk_size
-
     def __clear_lists(self, clear_discarded_cidr: bool = False):
         """Clear the internal lists used for processing"""
-        with self._lock:
-            self._cidrs.clear()
-            self.__list_chunks.clear()
-            self.__first_ip_chunks.clear()
-            self.__last_ip_chunks.clear()
-            self.__list_index.clear()
+        with self._write_lock:
+            self._snap = _Snapshot.empty()
+            self._check_ipaddr_cached.cache_clear()
             if clear_discarded_cidr:
                 self.discarded_cidrs.clear()
 
-    def __ip_ranges_overlap(self, first1: int, last1: int, first2: int, last2: int) -> bool:
-        """Check if two IP ranges overlap."""
-        return not (last1 < first2 or first1 > last2)
+    def __build_v4_buckets(self, v4_first_ips: typing.List[int], v4_last_ips: typing.List[int], v4_cidrs: typing.List[str]) -> typing.Optional[dict]:
+        """Build a direct-lookup table for IPv4 indexed by the top 16 bits of the address.
+
+        Each bucket holds the few (first_ip, last_ip, cidr) candidates for that /16, so the first
+        step of a lookup becomes a single dict probe followed by a scan over 1-2 candidates.
+        Only built when every IPv4 prefix is /16 or longer (a shorter prefix would spread one CIDR
+        over too many buckets); returns None otherwise and the lookup falls back to bisect.
+        """
+        if not v4_cidrs or any(int(cidr[cidr.rfind('/') + 1:]) < 16 for cidr in v4_cidrs):
+            return None
+        v4_buckets = {}
+        for first_ip, last_ip, cidr in zip(v4_first_ips, v4_last_ips, v4_cidrs):
+            for bucket_key in range(first_ip >> 16, (last_ip >> 16) + 1):
+                v4_buckets.setdefault(bucket_key, []).append((first_ip, last_ip, cidr))
+        return v4_buckets
 
     def _find_cidr_overlap(self, cidr: str) -> tuple:
         """Detects if a CIDR overlaps with any existing CIDR in the already processed list."""
         try:
-            if not self._cidrs:
+            snap = self._snap  # one consistent view for the whole check
+            if not snap.cidrs:
+                return False
+            cidr = self._normalize_cidr_suffix(cidr)
+            if ':' in cidr[:5]:
+                first_ips, last_ips, cidrs = snap.v6_first_ips, snap.v6_last_ips, snap.v6_cidrs
+            else:
+                first_ips, last_ips, cidrs = snap.v4_first_ips, snap.v4_last_ips, snap.v4_cidrs
+            if not first_ips:
                 return False
-            first_ip, last_ip = self.__get_first_last_ip_cidr(self._normalize_cidr_suffix(cidr))
-            match_root_index = bisect.bisect_right(self.__list_index, first_ip) - 1
-            if match_root_index < 0:
-                match_root_index = 0
-            # Verify current chunk
-            for i in range(len(self.__first_ip_chunks[match_root_index])):
-                if self.__ip_ranges_overlap(first_ip, last_ip, self.__first_ip_chunks[match_root_index][i], self.__last_ip_chunks[match_root_index][i]):
-                    return self.__list_chunks[match_root_index][i]
-            # Verify the prior and the next chunk (if exists)
-            for offset in [-1, 1]:
-                idx = match_root_index + offset
-                if 0 <= idx < len(self.__first_ip_chunks):
-                    for i in range(len(self.__first_ip_chunks[idx])):
-                        if self.__ip_ranges_overlap(first_ip, last_ip, self.__first_ip_chunks[idx][i], self.__last_ip_chunks[idx][i]):
-                            return self.__list_chunks[idx][i]
+            first_ip, last_ip = self.__get_first_last_ip_cidr(cidr)
+            # the stored ranges are sorted and non-overlapping, so only the predecessor and the
+            # successor of the insertion point can possibly overlap the new range
+            match_index = _bisect_right(first_ips, first_ip)
+            if match_index > 0 and last_ips[match_index - 1] >= first_ip:
+                return cidrs[match_index - 1]
+            if match_index < len(first_ips) and first_ips[match_index] <= last_ip:
+                return cidrs[match_index]
         except Exception as ERR:
             if self.__raise_on_error:
                 raise UnlimitedIPListException(f"Failed at UnlimitedIPList._find_cidr_overlap(): {str(ERR)}")
         return False
     
-    def _remove_overlapping_cidrs(self, new_list: typing.List[str]) -> None:
-        """Remove overlapping CIDRs from the new_list and sort them."""
-        self._log_debug(f"Processing {len(new_list)} CIDRs to remove overlaps and sorting them.")
-        cidrs = [(cidr, *self.__get_first_last_ip_cidr(cidr)) for cidr in new_list]
-        cidrs.sort(key=lambda x: x[1])  # Ordena por first_ip
-        filtered = []
-        prev_cidr, prev_first, prev_last = cidrs[0]
-        filtered.append(prev_cidr)
-        for cidr, first, last in cidrs[1:]:
-            if first <= prev_last:  # overlap
-                self.discarded_cidrs.append(cidr)
-            else:
-                filtered.append(cidr)
-                # prev_first, prev_last = first, last
-                prev_last = last
-        new_list = filtered.copy()
-        filtered.clear()
-        return new_list
-    
-    def __normalize_and_remove_invalid_cidr(self, ip_networks_list: typing.List[str]) -> typing.List[str]:
-        """Normalize the list of IPs in CIDR format and remove invalid CIDRs."""
-        normalized_list = []
-        for cidr in ip_networks_list:
-            valid_cidr = self.get_valid_cidr(cidr, normalize=True)
-            if valid_cidr:
-                if valid_cidr != cidr:
-                    self._log_debug(f"Normalized CIDR: {cidr} => {valid_cidr}")
-                normalized_list.append(valid_cidr)
-            else:
-                self._log_debug(f"Invalid CIDR: {cidr}")
-                self.discarded_cidrs.append(cidr)
-        return normalized_list
-
-    def __normalize_cidr(self, ip_networks_list: typing.List[str]) -> typing.List[str]:
-        """Normalize the list of IPs in CIDR format and remove invalid CIDRs. 
-        Just add /32 to IPv4 addresses and /128 to IPv6 addresses if they are not present."""
-        normalized_list = []
-        for cidr in ip_networks_list:
-            normalized_list.append(self._normalize_cidr_suffix(cidr))
-        return normalized_list
-
-    def __discard_invalid_cidr(self, ip_networks_list: typing.List[str]) -> typing.List[str]:
-        """Remove invalid CIDRs from the list."""
-        valid_list = []
-        for cidr in ip_networks_list:
-            if self.is_valid_cidr(cidr):
-                valid_list.append(cidr)
-            else:
-                self._log_debug(f"Invalid CIDR: {cidr}")
-                self.discarded_cidrs.append(cidr)
-        return valid_list
-
     def __process_list(self, ip_networks_list: typing.List[str], **kwargs) -> typing.List[str]:
         """Process the ip_networks_list"""
         try:
-            if kwargs.get("discarded_cidrs", []) == []:
+            if not kwargs.get("discarded_cidrs"):
                 self.discarded_cidrs.clear()  # Clear the last discarded CIDR list
-            
-            new_list = list(set(ip_networks_list))  # remove duplicates
-            new_list = [item.strip() for item in new_list if item.strip()]  # remove blank items
-            self._log_debug(f"Processing the ip_networks_list with {len(new_list)} unique items.")
-            
-            if len(new_list) == 0:
-                self._log_debug("The list is empty after removing duplicates and blank items, clearing the lists.")
-                self.__clear_lists()
-                return False  # No valid CIDRs to process
-            else:
-                # normalize the list of IPs in cidr format and test if the IP is valid
+
+            # single fused pass: strip, dedupe, normalize, validate and parse each entry exactly once.
+            # the old pipeline walked the list 5-6 times (set(), strip comprehension, normalize pass,
+            # discard pass, dedupe+sort, parse pass) allocating a transient list at each step.
+            parse_cidr = _parse_cidr
+            seen = set()
+            entries = []  # (first_ip, last_ip, cidr, family) tuples, parsed once and reused below
+            for raw in ip_networks_list:
+                stripped = raw.strip()
+                if not stripped or stripped in seen:
+                    continue  # remove duplicates and blank items
+                seen.add(stripped)
                 if self.__normalize_invalid_cidr:
-                    # Normalize the CIDRs and remove duplicates
-                    # Example: 10.10.10.10/8 => 10.0.0.0/8
-                    self._log_debug(f"Normalizing the list of IPs in CIDR format and removing invalid CIDRs. Current size: {len(new_list)}")
-                    new_list = self.__normalize_and_remove_invalid_cidr(new_list)
-                    self._log_debug(f"After normalization, the list size is {len(new_list)}.")
+                    # Normalize the CIDRs. Example: 10.10.10.10/8 => 10.0.0.0/8
+                    cidr = self.get_valid_cidr(stripped, normalize=True)
+                    if not cidr:
+                        if self._debug_enabled: self._log_debug(f"Invalid CIDR: {stripped}")
+                        self.discarded_cidrs.add(stripped)
+                        continue
+                    if cidr != stripped:
+                        if self._debug_enabled: self._log_debug(f"Normalized CIDR: {stripped} => {cidr}")
+                        if cidr in seen:
+                            continue  # duplicates that only differ before normalization
+                        seen.add(cidr)
                 else:
-                    # Just normalize the CIDRs adding /32 to IPv4 addresses and /128 to IPv6 addresses if they are not present
-                    # Do not remove invalid CIDRs
+                    # Just add /32 to IPv4 addresses and /128 to IPv6 addresses if not present.
                     # Example: 10.10.10.10 => 10.10.10.10/32
-                    self._log_debug("Normalizing the list of IPs in CIDR format without removing invalid CIDRs.")
-                    new_list = self.__normalize_cidr(new_list)
-                
-                self._log_debug(f"Removing invalid CIDRs from the list. Current size: {len(new_list)}")
-                new_list = self.__discard_invalid_cidr(new_list)
-                self._log_debug(f"After removing invalid CIDRs, the list size is {len(new_list)}.")
-                
-                if len(new_list) == 0:
-                    self._log_debug("All CIDRs were discarded, clearing the lists.")
-                    self.__clear_lists()
-                    return False  # No valid CIDRs to process
+                    cidr = self._normalize_cidr_suffix(stripped)
+                    if cidr != stripped:
+                        if cidr in seen:
+                            continue  # duplicates that only differ before normalization
+                        seen.add(cidr)
+                    if not self.is_valid_cidr(cidr):
+                        if self._debug_enabled: self._log_debug(f"Invalid CIDR: {cidr}")
+                        self.discarded_cidrs.add(cidr)
+                        continue
+                family, first_ip, last_ip, _prefix = parse_cidr(cidr)
+                entries.append((first_ip, last_ip, cidr, family))
+            if self._debug_enabled: self._log_debug(f"Processed the ip_networks_list with {len(seen)} unique items, {len(entries)} valid CIDRs.")
+
+            if len(entries) == 0:
+                if self._debug_enabled: self._log_debug("The list is empty after removing duplicates, blank items and invalid CIDRs, clearing the lists.")
+                self.__clear_lists()
+                return False  # No valid CIDRs to process
+
+            entries.sort()  # tuples sort by first_ip; ties (same network, different prefix) by last_ip
+
+            if kwargs.get("check_overlap", True):
+                # sorted by first_ip, so an entry can only overlap the running range of its predecessors.
+                # The running range is tracked per family: IPv4 and IPv6 integers share the sorted list,
+                # but an IPv6 range covering an IPv4 integer is not an overlap (add_ip_network agrees)
+                filtered = []
+                prev_last_v4 = prev_last_v6 = -1
+                for entry in entries:
+                    if entry[3] == _AF_INET6:
+                        if entry[0] <= prev_last_v6:  # overlap
+                            self.discarded_cidrs.add(entry[2])
+                        else:
+                            filtered.append(entry)
+                            prev_last_v6 = entry[1]
+                    else:
+                        if entry[0] <= prev_last_v4:  # overlap
+                            self.discarded_cidrs.add(entry[2])
+                        else:
+                            filtered.append(entry)
+                            prev_last_v4 = entry[1]
+                entries = filtered
+            if self._debug_enabled: self._log_debug(f"Discarded {len(self.discarded_cidrs)} invalid or overlapping CIDRs from the list ({self.discarded_cidrs})")
+
+            # keep one sorted structure per family: IPv4 integers stay small and bisect fast,
+            # and an IPv6 lookup never walks the IPv4 entries (and vice-versa)
+            v4_first_ips, v4_last_ips, v4_cidrs = array.array('I'), array.array('I'), []
+            v6_first_ips, v6_last_ips, v6_cidrs = [], [], []
+            new_list = []
+            for first_ip, last_ip, cidr, family in entries:
+                cidr = sys.intern(cidr)  # few distinct CIDRs, returned on every hit: make equality a pointer compare
+                new_list.append(cidr)
+                if family == _AF_INET6:
+                    v6_first_ips.append(first_ip); v6_last_ips.append(last_ip); v6_cidrs.append(cidr)
                 else:
-                    new_list = sorted(list(filter(None, sorted(list(dict.fromkeys(new_list))))), key=lambda ip: self.ip_to_int(ip.split("/")[0]))
-                    
-                    if kwargs.get("check_overlap", True):
-                        new_list = self._remove_overlapping_cidrs(new_list)
-                    self._log_debug(f"Discarded {len(self.discarded_cidrs)} invalid or overlapping CIDRs from the list ({self.discarded_cidrs})")
-                  
-                    chunk_size = len(new_list) if len(new_list) <= 100 else self.__find_balanced_chunk_size(len(new_list))
-                    self._log_debug(f"Splitting the list into chunks of size {chunk_size} for better performance.")
-                  
-                    ip_temp_list = [self.__get_first_last_ip_cidr(item) for item in new_list]
-                    with self._lock:
-                        self.__list_chunks = self.__split_list(new_list, chunk_size)
-                        self.__first_ip_chunks = self.__split_list([item[0] for item in ip_temp_list], chunk_size)
-                        self.__last_ip_chunks = self.__split_list([item[1] for item in ip_temp_list], chunk_size)
-                        self.__list_index = [item[0] for item in self.__first_ip_chunks]
-                        self._cidrs = new_list.copy()
-                    ip_temp_list.clear()
-                    new_list.clear()
-                    return True  # Successfully processed the list
+                    v4_first_ips.append(first_ip); v4_last_ips.append(last_ip); v4_cidrs.append(cidr)
+            v4_buckets = self.__build_v4_buckets(v4_first_ips, v4_last_ips, v4_cidrs)
+            # homogeneous-prefix lists (the usual rate-limiter shape) get a direct hash map:
+            # one dict probe per lookup, no search at all
+            v4_map24 = None
+            if v4_cidrs and all(cidr.endswith('/24') for cidr in v4_cidrs):
+                v4_map24 = {first_ip >> 8: cidr for first_ip, cidr in zip(v4_first_ips, v4_cidrs)}
+            v6_map64 = None
+            if v6_cidrs and all(cidr.endswith('/64') for cidr in v6_cidrs):
+                v6_map64 = {first_ip >> 64: cidr for first_ip, cidr in zip(v6_first_ips, v6_cidrs)}
+            snap = _Snapshot(v4_first_ips, v4_last_ips, v4_cidrs, v4_buckets, v4_map24,
+                             v6_first_ips, v6_last_ips, v6_cidrs, v6_map64, new_list)
+            with self._write_lock:
+                self._snap = snap  # single atomic rebind publishes the whole generation
+                self._check_ipaddr_cached.cache_clear()
+            return True  # Successfully processed the list
         except Exception as ERR:
             self.clear_ip_networks_list() # Clear the list on error
             if self.__raise_on_error:
@@ -437,10 +540,14 @@ class UnlimitedIPList:
         """Get the current unlimited ip networks list"""
         return list(self._cidrs)  # returns a copy of the list
 
+    def get_discarded_cidrs(self) -> typing.List[str]:
+        """Get the CIDRs discarded (invalid or overlapping) by the last list operation"""
+        return list(self.discarded_cidrs)
+
     def clear_ip_networks_list(self):
         """Clear the unlimited ip networks list"""
         self.__clear_lists(clear_discarded_cidr=True)
-        self._log_debug("Cleared the unlimited ip networks list.")
+        if self._debug_enabled: self._log_debug("Cleared the unlimited ip networks list.")
 
     def test_is_valid_ip_network(self, ipaddr: str) -> str:
         """ Check if the provided IP address or CIDR is valid to be added into the unlimited ip list.
@@ -452,20 +559,20 @@ class UnlimitedIPList:
             cidr = self._normalize_cidr_suffix(ipaddr.strip())
            
             if not self.is_valid_cidr(cidr):
-                self._log_debug(f"Invalid CIDR: {cidr}")
+                if self._debug_enabled: self._log_debug(f"Invalid CIDR: {cidr}")
                 if self.__raise_on_error:
                     raise UnlimitedIPListException(f"Invalid CIDR {cidr}.")
                 return False  # Invalid CIDR
            
-            if cidr in self._cidrs:
-                self._log_debug(f"CIDR {cidr} already exists in the list.")
+            if cidr in self._cidrs_set:
+                if self._debug_enabled: self._log_debug(f"CIDR {cidr} already exists in the list.")
                 if self.__raise_on_error:
                     raise UnlimitedIPListException(f"CIDR {cidr} already exists in the list.")
                 return False  # CIDR already exists in the list
            
             overlap_result = self._find_cidr_overlap(cidr)
             if overlap_result:
-                self._log_debug(f"CIDR {cidr} overlaps with existing CIDRs ({overlap_result}) in the list.")
+                if self._debug_enabled: self._log_debug(f"CIDR {cidr} overlaps with existing CIDRs ({overlap_result}) in the list.")
                 if self.__raise_on_error:
                     raise UnlimitedIPListException(f"CIDR {cidr} overlaps with existing CIDRs ({overlap_result}) in the list.")
                 return False  # CIDR overlaps with existing CIDRs
@@ -476,6 +583,56 @@ class UnlimitedIPList:
                 raise UnlimitedIPListException(f"Failed at UnlimitedIPList.add_ip(): {str(ERR)}")
         return False
         
+    def __insert_cidr(self, cidr: str) -> None:
+        """Insert a single already-validated, non-overlapping CIDR into the published lookup structures.
+
+        Exploits the fact that everything is already sorted: one bisect finds the slot and the
+        surrounding entries are copied with C-level slices, instead of re-validating, re-parsing
+        and re-sorting the entire list through __process_list on every add. Turns a streaming
+        add_ip_network from O(n log n) per insert into O(n) memcpy with no Python-level loop."""
+        cidr = sys.intern(cidr)  # published strings are interned, same as __process_list does
+        family, first_ip, last_ip, prefix = _parse_cidr(cidr)
+        with self._write_lock:
+            old = self._snap
+            v4_first_ips, v4_last_ips, v4_cidrs = old.v4_first_ips, old.v4_last_ips, old.v4_cidrs
+            v4_buckets, v4_map24 = old.v4_buckets, old.v4_map24
+            v6_first_ips, v6_last_ips, v6_cidrs = old.v6_first_ips, old.v6_last_ips, old.v6_cidrs
+            v6_map64 = old.v6_map64
+            if family == _AF_INET6:
+                index = _bisect_right(v6_first_ips, first_ip)
+                was_empty = not v6_cidrs
+                v6_first_ips = v6_first_ips[:index] + [first_ip] + v6_first_ips[index:]
+                v6_last_ips = v6_last_ips[:index] + [last_ip] + v6_last_ips[index:]
+                v6_cidrs = v6_cidrs[:index] + [cidr] + v6_cidrs[index:]
+                if prefix == 64 and (was_empty or v6_map64 is not None):
+                    v6_map64 = dict(v6_map64) if v6_map64 else {}
+                    v6_map64[first_ip >> 64] = cidr
+                else:
+                    v6_map64 = None  # list is no longer homogeneous /64
+            else:
+                index = _bisect_right(v4_first_ips, first_ip)
+                was_empty = not v4_cidrs
+                v4_first_ips = v4_first_ips[:index] + array.array('I', (first_ip,)) + v4_first_ips[index:]
+                v4_last_ips = v4_last_ips[:index] + array.array('I', (last_ip,)) + v4_last_ips[index:]
+                v4_cidrs = v4_cidrs[:index] + [cidr] + v4_cidrs[index:]
+                if prefix == 24 and (was_empty or v4_map24 is not None):
+                    v4_map24 = dict(v4_map24) if v4_map24 else {}
+                    v4_map24[first_ip >> 8] = cidr
+                else:
+                    v4_map24 = None  # list is no longer homogeneous /24
+                if prefix >= 16 and (was_empty or v4_buckets is not None):
+                    v4_buckets = dict(v4_buckets) if v4_buckets else {}
+                    for bucket_key in range(first_ip >> 16, (last_ip >> 16) + 1):
+                        v4_buckets[bucket_key] = v4_buckets.get(bucket_key, []) + [(first_ip, last_ip, cidr)]
+                else:
+                    v4_buckets = None  # a shorter prefix would spread over too many buckets
+            # cidrs is globally sorted by first_ip across both families (same order __process_list produces)
+            global_index = bisect.bisect_right(old.cidrs, first_ip, key=lambda c: _parse_cidr(c)[1])
+            cidrs = old.cidrs[:global_index] + [cidr] + old.cidrs[global_index:]
+            self._snap = _Snapshot(v4_first_ips, v4_last_ips, v4_cidrs, v4_buckets, v4_map24,
+                                   v6_first_ips, v6_last_ips, v6_cidrs, v6_map64, cidrs)
+            self._check_ipaddr_cached.cache_clear()
+
     def add_ip_network(self, ipaddr: str) -> bool:
         """Add an IPv4/IPv6 address or CIDR to unlimited ip list"""
         if not isinstance(ipaddr, str):
@@ -487,17 +644,16 @@ class UnlimitedIPList:
             if self.__normalize_invalid_cidr:
                 cidr = self.get_valid_cidr(cidr, normalize=True)
                 if not cidr:
-                    self.discarded_cidrs.append(ipaddr.strip())
+                    self.discarded_cidrs.add(ipaddr.strip())
                     return False
            
             cidr = self.test_is_valid_ip_network(cidr)
             if not cidr:
-                self.discarded_cidrs.append(ipaddr.strip())
+                self.discarded_cidrs.add(ipaddr.strip())
                 return False
-           
-            self._cidrs.append(cidr)
-            self.__process_list(self._cidrs, check_overlap=False, discarded_cidrs=self.discarded_cidrs)  # Process the list without check overlaps because is not needed
-           
+
+            self.__insert_cidr(cidr)  # single sorted insert instead of reprocessing the whole list
+
             return True
         except Exception as ERR:
             if self.__raise_on_error:
@@ -510,22 +666,22 @@ class UnlimitedIPList:
             raise TypeError("ipaddr_list must be a list of strings (IPv4/IPv6 addresses or valid CIDRs)")
         try:
             self.discarded_cidrs.clear()  # Clear the last discarded CIDR
-          
+            new_cidrs = list(self._cidrs)  # never mutate the published snapshot in place
             for ip in ipaddr_list:
                 cidr = ip.strip()
-          
+
                 if self.__normalize_invalid_cidr:
                     cidr = self.get_valid_cidr(cidr, normalize=True)
                 if not cidr:
-                    self.discarded_cidrs.append(ip.strip())
+                    self.discarded_cidrs.add(ip.strip())
                     continue
-          
+
                 cidr = self.test_is_valid_ip_network(cidr)
                 if not cidr:
-                    self.discarded_cidrs.append(ip.strip())
+                    self.discarded_cidrs.add(ip.strip())
                 else:
-                    self._cidrs.append(cidr)
-            self.__process_list(self._cidrs, check_overlap=True, discarded_cidrs=self.discarded_cidrs) # reprocess the list to check overlaps for the last time
+                    new_cidrs.append(cidr)
+            self.__process_list(new_cidrs, check_overlap=True, discarded_cidrs=self.discarded_cidrs) # reprocess the list to check overlaps for the last time
             return True
         except Exception as ERR:
             if self.__raise_on_error:
@@ -540,12 +696,12 @@ class UnlimitedIPList:
             return False
         try:
             ip = self._normalize_cidr_suffix(ipaddr.strip())
-            if ip and ip in self._cidrs:
-                self._cidrs.remove(ip)
-                self.__process_list(self._cidrs, check_overlap=False)  # Process the list without check overlaps because is not needed
+            if ip and ip in self._cidrs_set:  # O(1) membership via the set mirror instead of an O(n) list scan
+                new_cidrs = [cidr for cidr in self._cidrs if cidr != ip]
+                self.__process_list(new_cidrs, check_overlap=False)  # Process the list without check overlaps because is not needed
                 return True
             else:
-                self._log_debug(f"IP address or CIDR {ip} not found in the list.")
+                if self._debug_enabled: self._log_debug(f"IP address or CIDR {ip} not found in the list.")
                 return False
         except Exception as ERR:
             if self.__raise_on_error:
@@ -559,13 +715,15 @@ class UnlimitedIPList:
         if not self._cidrs:
             return False
         try:
-            for ip in ipaddr_list:
-                ip = self._normalize_cidr_suffix(ip.strip())
-                if ip and ip in self._cidrs:
-                    self._cidrs.remove(ip)
-                else:
+            # mark-for-removal with a set: one O(n) filter pass plus O(k) hash probes instead of
+            # k separate O(n) list.remove() scans
+            to_remove = {self._normalize_cidr_suffix(ip.strip()) for ip in ipaddr_list}
+            if self._debug_enabled:
+                for ip in sorted(to_remove - self._cidrs_set):
                     self._log_debug(f"IP address or CIDR {ip} not found in the list.")
-            self.__process_list(self._cidrs, check_overlap=False)  # Process the list to remove overlaps and sort it
+            to_remove &= self._cidrs_set
+            new_cidrs = [cidr for cidr in self._cidrs if cidr not in to_remove] if to_remove else self._cidrs
+            self.__process_list(new_cidrs, check_overlap=False)  # Process the list without check overlaps because is not needed
             return True
         except Exception as ERR:
             if self.__raise_on_error:
@@ -581,44 +739,129 @@ class UnlimitedIPList:
          result = self.unlimited_ip_list("192.168.1.1")
             `result` can be a network CIDR or False
         """
-        try:
-            if not self._cidrs:
-                return False
-            
-            if isinstance(ipaddr, int):
-                iplong = ipaddr
-            elif isinstance(ipaddr, str):
-                iplong = self.ip_to_int(ipaddr.strip())
-            if iplong is None or iplong <= 0:
-                self._log_debug(f"Invalid IP address: {ipaddr.strip()}")
-                if self.__raise_on_error:
-                    raise UnlimitedIPListException(f"Invalid IP address: {ipaddr.strip()}")
-                return False
+        return self.check_ipaddr(ipaddr)
 
-            match_root_index = bisect.bisect_right(self.__list_index, iplong) - 1
-            match_list_index = bisect.bisect_right(self.__first_ip_chunks[match_root_index], iplong) - 1
-            try:
-                network = self.__list_chunks[match_root_index][match_list_index]
-            except Exception:
-                network = False
-            inside_network = (iplong >= self.__first_ip_chunks[match_root_index][match_list_index]) and (iplong <= self.__last_ip_chunks[match_root_index][match_list_index])
-            return network if inside_network else False
-        except Exception as ERR:
-            if self.__raise_on_error:
-                raise UnlimitedIPListException(f"Failed at NoLimitList.check_ipaddr({ipaddr.strip()}): {str(ERR)}")
-            return False
-    
     def check_ipaddr(self, ipaddr: typing.Union[str, int]) -> typing.Union[str, bool]:
         """Check if an IP address is in the unlimited ip list. Returns the network CIDR if the IP is in the list,
         otherwise it returns False. Accepts both IPv4 and IPv6 addresses as strings or integers.
 
+        Results are cached per (address, list generation) in a functools.lru_cache, so repeated checks
+        of the same address skip the parse and the search entirely and a stale result can never be
+        served after the list changes.
+
         Ex:
 
          result = self.unlimited_ip_list.check_ipaddr(123456789)
 
          `result` can be a network CIDR or False
         """
-        return self.__call__(ipaddr)
+        snap = self._snap  # grab one generation; a concurrent rebuild cannot tear this view
+        if not isinstance(ipaddr, (str, int)):
+            # unsupported types (some unhashable) must not reach the lru_cache wrapper:
+            # report them like any unparseable address instead of raising TypeError
+            if not snap.cidrs:
+                return False
+            if self._debug_enabled: self._log_debug(f"Invalid IP address: {ipaddr}")
+            if self.__raise_on_error:
+                raise UnlimitedIPListException(f"Invalid IP address: {ipaddr}")
+            return False
+        return self._check_ipaddr_cached(ipaddr, snap)
+
+    def _check_ipaddr_impl(self, ipaddr: typing.Union[str, int], snap: _Snapshot, _bisect_right=_bisect_right) -> typing.Union[str, bool]:
+        """The uncached implementation behind check_ipaddr() - it runs against the snapshot it is given,
+        which is also part of the per-instance lru_cache key wrapped around it in __init__."""
+        # no try/except here: every step below is either a guarded index, a dict probe or pure int
+        # arithmetic, and the parse helper returns None instead of raising - a catch-all would only
+        # add frame bookkeeping to the hottest function and mask real bugs
+        if not snap.cidrs:
+            return False
+
+        if isinstance(ipaddr, int):
+            iplong = ipaddr
+            is_ipv6 = iplong > 0xFFFFFFFF
+        else:
+            ipaddr = ipaddr.strip()
+            is_ipv6 = ':' in ipaddr[:5]
+            iplong = _ip_to_int_cached(ipaddr)  # already stripped above, skip ip_to_int's re-strip
+        if iplong is None or iplong <= 0:
+            if self._debug_enabled: self._log_debug(f"Invalid IP address: {ipaddr}")
+            if self.__raise_on_error:
+                raise UnlimitedIPListException(f"Invalid IP address: {ipaddr}")
+            return False
+
+        if is_ipv6:
+            if iplong < snap.v6_min or iplong > snap.v6_max:
+                return False  # outside every stored IPv6 range, no need to probe anything
+            if snap.v6_map64 is not None:  # all networks are /64: one dict probe resolves the lookup
+                return snap.v6_map64.get(iplong >> 64, False)
+            first_ips, last_ips, cidrs = snap.v6_first_ips, snap.v6_last_ips, snap.v6_cidrs
+        else:
+            if iplong < snap.v4_min or iplong > snap.v4_max:
+                return False  # outside every stored IPv4 range, no need to probe anything
+            if snap.v4_map24 is not None:  # all networks are /24: one dict probe resolves the lookup
+                return snap.v4_map24.get(iplong >> 8, False)
+            if snap.v4_buckets is not None:  # O(1) first hop: one dict probe + a scan over 1-2 candidates
+                for first_ip, last_ip, network in snap.v4_buckets.get(iplong >> 16, ()):
+                    if first_ip <= iplong <= last_ip:
+                        return network
+                return False
+            first_ips, last_ips, cidrs = snap.v4_first_ips, snap.v4_last_ips, snap.v4_cidrs
+        match_index = _bisect_right(first_ips, iplong) - 1
+        if match_index < 0:
+            return False
+        # bisect_right already guarantees first_ips[match_index] <= iplong, only the upper bound is left
+        return cidrs[match_index] if iplong <= last_ips[match_index] else False
+    
+    def cache_info(self):
+        """Return the functools.lru_cache statistics of the check_ipaddr() cache (hits, misses, maxsize, currsize)."""
+        return self._check_ipaddr_cached.cache_info()
+
+    def check_ipaddrs(self, ipaddr_list: typing.List[typing.Union[str, int]], _bisect_right=_bisect_right) -> typing.List[typing.Union[str, bool]]:
+        """Check a batch of IP addresses in a single call. Returns a list with the network CIDR or False
+        for each entry, in the same order. Accepts both IPv4 and IPv6 addresses as strings or integers.
+        Invalid entries behave exactly like check_ipaddr(): they yield False, or raise
+        UnlimitedIPListException when the instance was created with raise_on_error=True.
+
+        Much faster than calling check_ipaddr() in a loop because the lookup structures and helpers
+        are resolved only once for the whole batch.
+
+        Ex:
+
+         results = self.unlimited_ip_list.check_ipaddrs(["192.168.1.1","10.0.0.1"])
+
+         `results` is a list where each item can be a network CIDR or False
+        """
+        if not isinstance(ipaddr_list, list):
+            raise TypeError("ipaddr_list must be a list of strings or integers (IPv4/IPv6 addresses)")
+        snap = self._snap  # the whole batch runs against one consistent generation
+        if not snap.cidrs:
+            return [False] * len(ipaddr_list)
+        v4_tables = (snap.v4_first_ips, snap.v4_last_ips, snap.v4_cidrs)
+        v6_tables = (snap.v6_first_ips, snap.v6_last_ips, snap.v6_cidrs)
+        ip_to_int = _ip_to_int_cached  # inputs are stripped in the loop below, skip the re-strip
+        results = []
+        append = results.append
+        for ipaddr in ipaddr_list:
+            if isinstance(ipaddr, int):
+                iplong = ipaddr
+                first_ips, last_ips, cidrs = v6_tables if iplong > 0xFFFFFFFF else v4_tables
+            elif isinstance(ipaddr, str):
+                ipaddr = ipaddr.strip()
+                first_ips, last_ips, cidrs = v6_tables if ':' in ipaddr[:5] else v4_tables
+                iplong = ip_to_int(ipaddr)
+            else:
+                iplong = None  # unsupported type, reported just like an unparseable address
+            if iplong is None or iplong <= 0:
+                if self._debug_enabled: self._log_debug(f"Invalid IP address: {ipaddr}")
+                if self.__raise_on_error:
+                    raise UnlimitedIPListException(f"Invalid IP address: {ipaddr}")
+                append(False)
+                continue
+            match_index = _bisect_right(first_ips, iplong) - 1
+            append(cidrs[match_index] if match_index >= 0 and iplong <= last_ips[match_index] else False)
+        return results
+
+    check_ipaddr_many = check_ipaddrs  # alias for the batch lookup
 
 if __name__ == "__main__":
     print("This module is not meant to be run directly. Please import it in your code.")